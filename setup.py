@@ -0,0 +1,24 @@
+"""Optional build hook compiling TubeFetch with mypyc.
+
+Project metadata lives in ``pyproject.toml``. Set ``TUBE_FETCH_USE_MYPYC=1``
+to compile the CLI and core modules into C extensions; without it (or when
+mypyc is unavailable) the package is installed as pure Python.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("TUBE_FETCH_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc is not installed; building pure Python modules", file=sys.stderr)
+    else:
+        ext_modules = mypycify(["tube_fetch/cli.py"])
+
+setup(ext_modules=ext_modules)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 from unittest import mock
 
 import pytest
 
-from tube_fetch import cli
+from tube_fetch import cli, core
 
 
 @pytest.fixture(autouse=True)
@@ -20,7 +21,7 @@ def patch_downloader(monkeypatch):
 
 def test_cli_info_mode_json(capsys, patch_downloader):
     fake_extract, _ = patch_downloader
-    fake_extract.return_value.to_json.return_value = "{}"
+    fake_extract.return_value.to_json_bytes.return_value = b"{}"
 
     exit_code = cli.main([
         "https://youtu.be/demo",
@@ -33,6 +34,47 @@ def test_cli_info_mode_json(capsys, patch_downloader):
     assert captured.out.strip() == "{}"
 
 
+def test_cli_info_mode_json_many_urls(capsys, patch_downloader):
+    fake_extract, _ = patch_downloader
+    fake_extract.side_effect = lambda url, **kwargs: core.VideoInfo(
+        id=url[-1],
+        title="Demo",
+        uploader=None,
+        duration=None,
+        webpage_url=url,
+    )
+
+    exit_code = cli.main([
+        "https://youtu.be/a",
+        "https://youtu.be/b",
+        "--info",
+        "--json",
+    ])
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert [item["id"] for item in json.loads(captured.out)] == ["a", "b"]
+
+
+def test_cli_info_mode_cache_flags(patch_downloader):
+    fake_extract, _ = patch_downloader
+    fake_extract.return_value.to_json_bytes.return_value = b"{}"
+
+    cli.main(["https://youtu.be/demo", "--info", "--json", "--no-cache", "--cache-ttl", "60"])
+
+    fake_extract.assert_called_once_with(
+        "https://youtu.be/demo", proxy=None, use_cache=False, cache_ttl=60.0
+    )
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-1"])
+def test_cli_cache_ttl_validation(capsys, value):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["https://youtu.be/demo", "--info", f"--cache-ttl={value}"])
+    assert exc.value.code == 2
+    assert "non-negative number of seconds" in capsys.readouterr().err
+
+
 def test_cli_download_mode(capsys, patch_downloader):
     _, fake_downloader = patch_downloader
 
@@ -44,9 +86,196 @@ def test_cli_download_mode(capsys, patch_downloader):
     fake_downloader.download.assert_called_once()
 
 
+def test_cli_download_many_urls(capsys, patch_downloader):
+    _, fake_downloader = patch_downloader
+    fake_downloader.download_many = mock.AsyncMock(return_value=["a.mp4", "b.mp4"])
+
+    exit_code = cli.main([
+        "https://youtu.be/a",
+        "https://youtu.be/b",
+        "--concurrency",
+        "2",
+    ])
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert captured.out.split() == ["a.mp4", "b.mp4"]
+    fake_downloader.download.assert_not_called()
+    fake_downloader.download_many.assert_awaited_once()
+    assert fake_downloader.download_many.call_args.kwargs["concurrency"] == 2
+
+
+def test_cli_download_many_urls_with_workers(capsys, patch_downloader):
+    _, fake_downloader = patch_downloader
+    fake_downloader.download_many_parallel.return_value = ["a.mp4", "b.mp4"]
+
+    exit_code = cli.main(["https://youtu.be/a", "https://youtu.be/b", "--workers", "3"])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.split() == ["a.mp4", "b.mp4"]
+    assert fake_downloader.download_many_parallel.call_args.kwargs["workers"] == 3
+
+
+def test_cli_download_concat_playlist(capsys, patch_downloader):
+    _, fake_downloader = patch_downloader
+    fake_downloader.download_batch.return_value = ["a.mp4", "b.mp4"]
+
+    exit_code = cli.main(["https://youtu.be/a", "https://youtu.be/b", "--concat-playlist"])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.split() == ["a.mp4", "b.mp4"]
+    fake_downloader.download_batch.assert_called_once()
+
+
+def test_cli_download_with_info(capsys, patch_downloader):
+    _, fake_downloader = patch_downloader
+    info = core.VideoInfo(
+        id="demo",
+        title="Demo",
+        uploader=None,
+        duration=None,
+        webpage_url="https://youtu.be/demo",
+    )
+    fake_downloader.fetch_and_download.return_value = (info, "video.mp4")
+
+    exit_code = cli.main(["https://youtu.be/demo", "--with-info"])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "Title: Demo",
+        "URL: https://youtu.be/demo",
+        "video.mp4",
+    ]
+    fake_downloader.download.assert_not_called()
+
+
+def test_cli_download_with_info_json(capsys, patch_downloader):
+    _, fake_downloader = patch_downloader
+    fake_downloader.fetch_and_download.side_effect = lambda url, **kwargs: (
+        core.VideoInfo(
+            id=url[-1],
+            title="Demo",
+            uploader=None,
+            duration=None,
+            webpage_url=url,
+        ),
+        f"{url[-1]}.mp4",
+    )
+
+    exit_code = cli.main(["https://youtu.be/a", "https://youtu.be/b", "--with-info", "--json"])
+
+    assert exit_code == 0
+    documents = json.loads(capsys.readouterr().out)
+    assert [(doc["id"], doc["filename"]) for doc in documents] == [
+        ("a", "a.mp4"),
+        ("b", "b.mp4"),
+    ]
+
+
 def test_cli_extra_option_validation(capsys):
     with pytest.raises(SystemExit) as exc:
         cli.main(["https://youtu.be/demo", "--extra-option", "invalid"])
     assert exc.value.code == 2
     captured = capsys.readouterr()
     assert "Invalid --extra-option" in captured.err
+
+
+def test_parse_extra_options_splits_on_first_equals():
+    assert cli._parse_extra_options(["a=1", "b=x=y", "c="]) == {
+        "a": "1",
+        "b": "x=y",
+        "c": "",
+    }
+
+
+def test_cli_reuses_parser_and_logging_setup(monkeypatch, patch_downloader):
+    basic_config = mock.Mock()
+    monkeypatch.setattr(cli.logging, "basicConfig", basic_config)
+    monkeypatch.setattr(cli, "_LOG_CONFIGURED", False)
+    root = cli.logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    previous_level = root.level
+
+    try:
+        cli.main(["https://youtu.be/demo"])
+        cli.main(["https://youtu.be/demo", "--verbose"])
+
+        assert cli._build_parser() is cli._build_parser()
+        basic_config.assert_called_once()
+        assert root.level == cli.logging.DEBUG
+    finally:
+        root.setLevel(previous_level)
+
+
+def test_cli_leaves_host_logging_configuration_alone(monkeypatch, patch_downloader):
+    basic_config = mock.Mock()
+    monkeypatch.setattr(cli.logging, "basicConfig", basic_config)
+    monkeypatch.setattr(cli, "_LOG_CONFIGURED", False)
+    root = cli.logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [cli.logging.NullHandler()])
+    previous_level = root.level
+    root.setLevel(cli.logging.WARNING)
+
+    try:
+        cli.main(["https://youtu.be/demo"])
+        cli.main(["https://youtu.be/demo", "--verbose"])
+
+        basic_config.assert_not_called()
+        assert root.level == cli.logging.WARNING
+    finally:
+        root.setLevel(previous_level)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["https://youtu.be/a"],
+        ["https://youtu.be/a", "https://youtu.be/b", "--concurrency", "2", "--verbose"],
+        ["--info", "--json", "https://youtu.be/a", "--cache-ttl=60", "--no-cache"],
+        [
+            "https://youtu.be/a",
+            "--output",
+            "out",
+            "--audio-only",
+            "--format=best",
+            "--proxy",
+            "http://proxy",
+            "--extra-option",
+            "a=1",
+            "--extra-option=b=2",
+            "--workers",
+            "3",
+            "--with-info",
+            "--concat-playlist",
+        ],
+    ],
+)
+def test_fast_parse_matches_argparse(argv):
+    fast = cli._fast_parse(argv)
+
+    assert fast is not None
+    assert vars(fast) == vars(cli._build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--help"],
+        ["https://youtu.be/a", "--verb"],
+        ["https://youtu.be/a", "--concurrency", "0"],
+        ["https://youtu.be/a", "--format"],
+        ["https://youtu.be/a", "--json=yes"],
+        ["https://youtu.be/a", "--cache-ttl", "nan"],
+        ["https://youtu.be/a", "--cache-ttl=inf"],
+        ["https://youtu.be/a", "--info", "https://youtu.be/b"],
+    ],
+)
+def test_fast_parse_defers_unusual_input_to_argparse(argv):
+    assert cli._fast_parse(argv) is None
+
+
+def test_cli_main_skips_argparse_for_common_usage(monkeypatch, patch_downloader):
+    monkeypatch.setattr(cli, "_build_parser", mock.Mock(side_effect=AssertionError))
+
+    assert cli.main(["https://youtu.be/demo", "--audio-only"]) == 0
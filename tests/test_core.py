@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import dataclasses
+import json
 import pathlib
+import pickle
+import sys
 from unittest import mock
 
 import pytest
@@ -18,6 +24,13 @@ def patch_backend(monkeypatch):
     yield fake_module, fake_context
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TUBE_FETCH_CACHE_DIR", str(cache_dir))
+    yield cache_dir
+
+
 def test_extract_video_info(patch_backend):
     _, fake_context = patch_backend
     info_payload = {
@@ -42,6 +55,133 @@ def test_extract_video_info(patch_backend):
     assert info.to_json().startswith("{\n  \"id\": \"abc123\"")
 
 
+def test_info_from_dict_fills_required_fields():
+    info = core._info_from_dict({"id": None, "duration": 5}, "https://youtu.be/abc123")
+
+    assert info == core.VideoInfo(
+        id="",
+        title="",
+        uploader=None,
+        duration=5,
+        webpage_url="https://youtu.be/abc123",
+    )
+
+
+def test_extract_video_info_skips_output_template(patch_backend, monkeypatch):
+    fake_module, fake_context = patch_backend
+    fake_context.extract_info.return_value = {"id": "abc123"}
+    monkeypatch.setattr(core.pathlib.Path, "cwd", mock.Mock(side_effect=AssertionError))
+
+    core.extract_video_info("https://youtu.be/abc123", use_cache=False)
+
+    assert "outtmpl" not in fake_module.YoutubeDL.call_args.args[0]
+
+
+def test_video_downloader_resolves_cwd_once(patch_backend, monkeypatch):
+    fake_module, _ = patch_backend
+    fake_module.YoutubeDL.return_value.extract_info.return_value = {"_filename": "/tmp/a"}
+    cwd = mock.Mock(return_value=pathlib.Path("/work"))
+    monkeypatch.setattr(core.pathlib.Path, "cwd", cwd)
+
+    downloader = core.VideoDownloader()
+    downloader.download("https://youtu.be/a")
+    downloader.download("https://youtu.be/b", audio_only=True)
+
+    assert cwd.call_count == 1
+
+
+def test_video_info_to_json_matches_stdlib_fallback(monkeypatch):
+    info = core.VideoInfo(
+        id="abc123",
+        title="Vidéo 示例",
+        uploader=None,
+        duration=120,
+        webpage_url="https://youtu.be/abc123",
+    )
+
+    fast = info.to_json()
+    monkeypatch.setattr(core, "orjson", None)
+    fallback = info.to_json()
+
+    assert json.loads(fast) == json.loads(fallback)
+    assert "示例" in fallback
+
+    extended = info.to_json_bytes(filename="/tmp/a.mp4")
+    assert json.loads(extended) == {**json.loads(fast), "filename": "/tmp/a.mp4"}
+
+
+def test_extract_video_info_uses_disk_cache(patch_backend, isolated_cache):
+    _, fake_context = patch_backend
+    fake_context.extract_info.return_value = {"id": "abc123", "title": "Sample Video"}
+
+    first = core.extract_video_info("https://youtu.be/abc123")
+    second = core.extract_video_info("https://youtu.be/abc123")
+
+    assert first == second
+    assert fake_context.extract_info.call_count == 1
+    assert len(list(isolated_cache.glob("*.json"))) == 1
+
+    core.extract_video_info("https://youtu.be/abc123", use_cache=False)
+    assert fake_context.extract_info.call_count == 2
+
+
+def test_extract_video_info_without_home_directory(patch_backend, monkeypatch):
+    _, fake_context = patch_backend
+    fake_context.extract_info.return_value = {"id": "abc123", "title": "Sample Video"}
+    monkeypatch.delenv("TUBE_FETCH_CACHE_DIR")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(
+        core.pathlib.Path,
+        "home",
+        mock.Mock(side_effect=RuntimeError("Could not determine home directory.")),
+    )
+
+    core.extract_video_info("https://youtu.be/abc123")
+    info = core.extract_video_info("https://youtu.be/abc123")
+
+    assert info.id == "abc123"
+    assert fake_context.extract_info.call_count == 2
+
+
+def test_meta_cache_drops_expired_entries(tmp_path, monkeypatch):
+    cache = core._MetaCache(tmp_path)
+    now = [1000.0]
+    monkeypatch.setattr(core.time, "time", lambda: now[0])
+
+    cache.set("https://youtu.be/abc123", {"id": "abc123"}, ttl=60)
+    assert cache.get("https://youtu.be/abc123") == {"id": "abc123"}
+
+    now[0] += 61
+    assert cache.get("https://youtu.be/abc123") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"expires": "soon", "value": {"id": "abc123"}}',
+        '{"expires": NaN, "value": {"id": "abc123"}}',
+        '{"expires": 1e300, "value": ["abc123"]}',
+        '["not", "a", "dict"]',
+    ],
+)
+def test_meta_cache_treats_malformed_entries_as_misses(tmp_path, content):
+    cache = core._MetaCache(tmp_path)
+    cache._path("https://youtu.be/abc123").write_text(content, encoding="utf-8")
+
+    assert cache.get("https://youtu.be/abc123") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_meta_cache_removes_temp_file_when_replace_fails(tmp_path, monkeypatch):
+    cache = core._MetaCache(tmp_path)
+    monkeypatch.setattr(core.os, "replace", mock.Mock(side_effect=OSError("read-only")))
+
+    cache.set("https://youtu.be/abc123", {"id": "abc123"}, ttl=60)
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_download_video_returns_path(patch_backend):
     _, fake_context = patch_backend
     fake_context.extract_info.return_value = {"_filename": "/tmp/video.mp4"}
@@ -51,6 +191,15 @@ def test_download_video_returns_path(patch_backend):
     assert path == pathlib.Path("/tmp/video.mp4")
 
 
+def test_download_video_can_return_plain_string(patch_backend):
+    _, fake_context = patch_backend
+    fake_context.extract_info.return_value = {"_filename": "/tmp/video.mp4"}
+
+    path = core.download_video("https://youtu.be/abc123", as_path=False)
+
+    assert path == "/tmp/video.mp4"
+
+
 def test_download_video_handles_requested_downloads(patch_backend):
     _, fake_context = patch_backend
     fake_context.extract_info.return_value = {
@@ -62,6 +211,17 @@ def test_download_video_handles_requested_downloads(patch_backend):
     assert path == pathlib.Path("/tmp/audio.m4a")
 
 
+def test_download_video_picks_first_requested_download_with_filename(patch_backend):
+    _, fake_context = patch_backend
+    fake_context.extract_info.return_value = {
+        "requested_downloads": [{}, {"_filename": "/tmp/audio.m4a"}, {"_filename": "/tmp/b"}]
+    }
+
+    path = core.download_video("https://youtu.be/abc123")
+
+    assert path == pathlib.Path("/tmp/audio.m4a")
+
+
 def test_download_video_raises_when_no_filename(patch_backend):
     _, fake_context = patch_backend
     fake_context.extract_info.return_value = {}
@@ -71,14 +231,311 @@ def test_download_video_raises_when_no_filename(patch_backend):
 
 
 def test_video_downloader_wrapper(patch_backend):
-    fake_module, fake_context = patch_backend
-    fake_context.extract_info.return_value = {"_filename": "/tmp/video.mp4"}
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    info_payload = {"id": "abc123", "title": "Sample Video"}
+    fake_ydl.extract_info.return_value = info_payload
+    fake_ydl.process_ie_result.return_value = {"_filename": "/tmp/video.mp4"}
 
     downloader = core.VideoDownloader(output_dir=pathlib.Path("/videos"), proxy="http://proxy")
 
     downloader.fetch_info("https://youtu.be/abc123")
-    downloader.download("https://youtu.be/abc123", audio_only=True, format="best")
+    path = downloader.download("https://youtu.be/abc123", audio_only=True, format="best")
+
+    assert path == pathlib.Path("/tmp/video.mp4")
+    assert fake_module.YoutubeDL.call_count == 2
+    fake_ydl.extract_info.assert_called_once_with(
+        "https://youtu.be/abc123", download=False, process=False
+    )
+    fake_ydl.process_ie_result.assert_called_once_with(info_payload, download=True)
+
+
+def test_video_downloader_download_after_fetch_info_reselects_format(patch_backend):
+    fake_module, _ = patch_backend
+    instances = []
+
+    def make_ydl(options):
+        ydl = mock.MagicMock()
+        ydl.options = options
+
+        def extract_info(url, download, process=True):
+            info = {"id": "abc123", "title": "Sample Video", "formats": [{"format_id": "a"}]}
+            if process:
+                # What yt-dlp's format selection leaves behind in the dict.
+                info.update({"format_id": "v+a", "requested_formats": ["v", "a"]})
+            return info
+
+        ydl.extract_info.side_effect = extract_info
+        ydl.process_ie_result.return_value = {"_filename": "/tmp/audio.m4a"}
+        instances.append(ydl)
+        return ydl
+
+    fake_module.YoutubeDL.side_effect = make_ydl
+
+    downloader = core.VideoDownloader()
+    downloader.fetch_info("https://youtu.be/abc123")
+    downloader.download("https://youtu.be/abc123", audio_only=True)
+
+    fetch_ydl, audio_ydl = instances
+    fetch_ydl.process_ie_result.assert_not_called()
+    assert audio_ydl.options["format"] == "bestaudio/best"
+    (info,), kwargs = audio_ydl.process_ie_result.call_args
+    assert kwargs == {"download": True}
+    assert "requested_formats" not in info
+    assert "format_id" not in info
+    assert info["formats"] == [{"format_id": "a"}]
+
+
+def test_video_downloader_fetch_info_resolves_url_results(patch_backend):
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    fake_ydl.extract_info.return_value = {"_type": "url", "url": "https://youtu.be/abc123"}
+    fake_ydl.process_ie_result.return_value = {"id": "abc123", "title": "Sample Video"}
+
+    downloader = core.VideoDownloader()
+    info = downloader.fetch_info("https://youtu.be/short")
+
+    assert info.title == "Sample Video"
+    assert downloader._cached_info("https://youtu.be/short") is None
+
+
+def test_video_downloader_reuses_youtube_dl_instance(patch_backend):
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    fake_ydl.extract_info.return_value = {"_filename": "/tmp/video.mp4"}
+
+    with core.VideoDownloader() as downloader:
+        downloader.download("https://youtu.be/a")
+        downloader.download("https://youtu.be/b")
+
+    assert fake_module.YoutubeDL.call_count == 1
+    fake_ydl.__enter__.assert_not_called()
+    fake_ydl.close.assert_called_once_with()
+
+
+def test_video_downloader_picks_up_reassigned_settings(patch_backend):
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    fake_ydl.extract_info.return_value = {"_filename": "/tmp/a"}
+
+    downloader = core.VideoDownloader(output_dir=pathlib.Path("/old"), proxy="http://old")
+    downloader.download("https://youtu.be/a")
+
+    downloader.output_dir = pathlib.Path("/new")
+    downloader.proxy = "http://new"
+    downloader.download("https://youtu.be/a")
 
     assert fake_module.YoutubeDL.call_count == 2
-    fake_context.extract_info.assert_any_call("https://youtu.be/abc123", download=False)
-    fake_context.extract_info.assert_any_call("https://youtu.be/abc123", download=True)
+    options = fake_module.YoutubeDL.call_args.args[0]
+    assert options["outtmpl"] == str(pathlib.Path("/new") / "%(title)s.%(ext)s")
+    assert options["proxy"] == "http://new"
+    assert downloader.output_dir == pathlib.Path("/new")
+    fake_ydl.close.assert_called()
+
+
+def test_video_downloader_default_options_share_one_session(patch_backend):
+    fake_module, _ = patch_backend
+    fake_module.YoutubeDL.return_value.extract_info.return_value = {"_filename": "/tmp/a"}
+    downloader = core.VideoDownloader()
+
+    downloader.download("https://youtu.be/a")
+    downloader.download("https://youtu.be/b")
+
+    assert list(downloader._ydls) == [""]
+    assert fake_module.YoutubeDL.call_count == 1
+
+
+def test_video_downloader_closes_least_recently_used_session(patch_backend):
+    fake_module, _ = patch_backend
+    fake_module.YoutubeDL.side_effect = lambda options: mock.MagicMock(
+        extract_info=mock.Mock(return_value={"_filename": "/tmp/a"})
+    )
+    downloader = core.VideoDownloader()
+
+    downloader.download("https://youtu.be/a")
+    first = downloader._ydls[""]
+    for index in range(core._MAX_OPEN_SESSIONS):
+        downloader.download("https://youtu.be/a", format=str(index))
+
+    assert len(downloader._ydls) == core._MAX_OPEN_SESSIONS
+    assert "" not in downloader._ydls
+    first.close.assert_called_once_with()
+
+
+def test_video_downloader_layers_call_options(patch_backend, monkeypatch):
+    fake_module, _ = patch_backend
+    monkeypatch.setattr(core, "_impersonate_target", lambda: None)
+    fake_module.YoutubeDL.return_value.extract_info.return_value = {"_filename": "/tmp/a.m4a"}
+
+    downloader = core.VideoDownloader(output_dir=pathlib.Path("/videos"), proxy="http://proxy")
+    downloader.download(
+        "https://youtu.be/abc123",
+        audio_only=True,
+        extra_options={"retries": "3", "quiet": False},
+    )
+
+    options = fake_module.YoutubeDL.call_args.args[0]
+    assert options == {
+        "outtmpl": str(pathlib.Path("/videos") / "%(title)s.%(ext)s"),
+        "format": "bestaudio/best",
+        "noplaylist": True,
+        "quiet": False,
+        "nocheckcertificate": True,
+        "proxy": "http://proxy",
+        "retries": "3",
+    }
+
+
+def test_video_downloader_download_batch_shares_session(patch_backend):
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    fake_ydl.extract_info.side_effect = lambda url, download: {
+        "_filename": f"/tmp/{url.rsplit('/', 1)[-1]}.mp4"
+    }
+
+    downloader = core.VideoDownloader()
+    paths = downloader.download_batch(["https://youtu.be/a", "https://youtu.be/b"])
+
+    assert paths == [pathlib.Path("/tmp/a.mp4"), pathlib.Path("/tmp/b.mp4")]
+    assert fake_module.YoutubeDL.call_count == 1
+
+
+def test_video_downloader_fetch_and_download_uses_one_extraction(patch_backend):
+    fake_module, _ = patch_backend
+    fake_ydl = fake_module.YoutubeDL.return_value
+    fake_ydl.extract_info.return_value = {
+        "id": "abc123",
+        "title": "Sample Video",
+        "requested_downloads": [{"_filename": "/tmp/video.mp4"}],
+    }
+
+    downloader = core.VideoDownloader()
+    info, path = downloader.fetch_and_download("https://youtu.be/abc123")
+
+    assert info.id == "abc123"
+    assert info.webpage_url == "https://youtu.be/abc123"
+    assert path == pathlib.Path("/tmp/video.mp4")
+    fake_ydl.extract_info.assert_called_once_with("https://youtu.be/abc123", download=True)
+
+
+def test_build_options_impersonates_when_curl_cffi_available(monkeypatch):
+    fake_impersonate = mock.MagicMock()
+    monkeypatch.setitem(sys.modules, "yt_dlp", mock.MagicMock())
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking", mock.MagicMock())
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking.impersonate", fake_impersonate)
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking._curlcffi", mock.MagicMock())
+    monkeypatch.setattr(core.importlib.util, "find_spec", lambda name: object())
+    core._impersonate_target.cache_clear()
+
+    try:
+        options = core._build_options(download=False)
+    finally:
+        core._impersonate_target.cache_clear()
+
+    fake_impersonate.ImpersonateTarget.from_str.assert_called_once_with("chrome")
+    assert options["impersonate"] is fake_impersonate.ImpersonateTarget.from_str.return_value
+
+
+def test_build_options_skips_impersonation_for_unsupported_curl_cffi(monkeypatch):
+    monkeypatch.setitem(sys.modules, "yt_dlp", mock.MagicMock())
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking", mock.MagicMock())
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking.impersonate", mock.MagicMock())
+    # A None entry makes the import raise ImportError, as yt-dlp does when
+    # the installed curl_cffi version is not supported.
+    monkeypatch.setitem(sys.modules, "yt_dlp.networking._curlcffi", None)
+    monkeypatch.setattr(core.importlib.util, "find_spec", lambda name: object())
+    core._impersonate_target.cache_clear()
+
+    try:
+        options = core._build_options(download=False)
+    finally:
+        core._impersonate_target.cache_clear()
+
+    assert "impersonate" not in options
+
+
+def test_video_downloader_info_cache_expires(patch_backend, monkeypatch):
+    fake_module, _ = patch_backend
+    fake_context = fake_module.YoutubeDL.return_value
+    fake_context.extract_info.side_effect = [
+        {"id": "abc123", "title": "Sample Video"},
+        {"id": "abc123", "title": "Sample Video"},
+        {"_filename": "/tmp/video.mp4"},
+    ]
+    clock = [100.0]
+    monkeypatch.setattr(core.time, "monotonic", lambda: clock[0])
+
+    downloader = core.VideoDownloader(info_cache_ttl=10)
+
+    downloader.fetch_info("https://youtu.be/abc123")
+    downloader.fetch_info("https://youtu.be/abc123")
+    assert fake_context.extract_info.call_count == 1
+
+    clock[0] += 11
+    downloader.fetch_info("https://youtu.be/abc123")
+    assert fake_context.extract_info.call_count == 2
+
+    clock[0] += 11
+    path = downloader.download("https://youtu.be/abc123")
+
+    assert path == pathlib.Path("/tmp/video.mp4")
+    fake_context.extract_info.assert_called_with("https://youtu.be/abc123", download=True)
+    fake_context.process_ie_result.assert_not_called()
+
+
+def test_video_downloader_download_many_preserves_order(patch_backend):
+    fake_module, fake_context = patch_backend
+    fake_context.extract_info.side_effect = lambda url, download: {
+        "_filename": f"/tmp/{url.rsplit('/', 1)[-1]}.mp4"
+    }
+
+    downloader = core.VideoDownloader(output_dir=pathlib.Path("/videos"))
+    urls = ["https://youtu.be/a", "https://youtu.be/b", "https://youtu.be/c"]
+
+    paths = asyncio.run(downloader.download_many(urls, concurrency=2))
+
+    assert paths == [pathlib.Path(f"/tmp/{name}.mp4") for name in "abc"]
+    assert fake_module.YoutubeDL.call_count == 3
+
+
+@dataclasses.dataclass(frozen=True)
+class _ImpersonateTarget:
+    client: str
+
+
+class _PicklingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Runs calls in threads after a pickle round trip, like a process pool."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        fn, args, kwargs = pickle.loads(pickle.dumps((fn, args, kwargs)))
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_video_downloader_download_many_parallel(patch_backend, monkeypatch):
+    fake_module, fake_context = patch_backend
+    fake_context.extract_info.side_effect = lambda url, download: {
+        "_filename": f"/tmp/{url.rsplit('/', 1)[-1]}.mp4"
+    }
+    monkeypatch.setattr(core, "_impersonate_target", lambda: _ImpersonateTarget("chrome"))
+    # Child processes would not see the patched backend; threads exercise
+    # the same code path once the worker and its options survive pickling.
+    monkeypatch.setattr(core.concurrent.futures, "ProcessPoolExecutor", _PicklingExecutor)
+
+    downloader = core.VideoDownloader()
+    paths = downloader.download_many_parallel(
+        ["https://youtu.be/a", "https://youtu.be/b"],
+        workers=2,
+        extra_options={"retries": 3},
+    )
+
+    assert paths == [pathlib.Path("/tmp/a.mp4"), pathlib.Path("/tmp/b.mp4")]
+    options = fake_module.YoutubeDL.call_args.args[0]
+    assert options["impersonate"] == _ImpersonateTarget("chrome")
+    assert options["retries"] == 3
+
+
+def test_video_downloader_download_many_rejects_bad_concurrency(patch_backend):
+    downloader = core.VideoDownloader()
+
+    with pytest.raises(ValueError):
+        asyncio.run(downloader.download_many(["https://youtu.be/a"], concurrency=0))
@@ -2,22 +2,157 @@
 
 from __future__ import annotations
 
-import argparse
+import asyncio
+import functools
 import logging
+import math
 import pathlib
 import sys
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional
 
-from .core import VideoDownloader, extract_video_info
+from .core import _DEFAULT_CACHE_TTL, VideoDownloader, VideoInfo, extract_video_info
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import argparse
 
 LOGGER = logging.getLogger(__name__)
 
+_LOG_CONFIGURED = False
+
+_DEFAULT_CONCURRENCY = 4
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        import argparse
+
+        raise argparse.ArgumentTypeError(f"Expected a positive integer, got {value!r}")
+    return number
+
+
+def _non_negative_seconds(value: str) -> float:
+    seconds = float(value)
+    if not math.isfinite(seconds) or seconds < 0:
+        import argparse
+
+        raise argparse.ArgumentTypeError(
+            f"Expected a non-negative number of seconds, got {value!r}"
+        )
+    return seconds
+
+
+# Option tables for _fast_parse(); they must mirror _build_parser().
+_FAST_SWITCHES = {
+    "--audio-only": "audio_only",
+    "--info": "info",
+    "--with-info": "with_info",
+    "--concat-playlist": "concat_playlist",
+    "--json": "json",
+    "--no-cache": "no_cache",
+    "--verbose": "verbose",
+}
+_FAST_VALUES: Dict[str, tuple[str, Callable[[str], Any]]] = {
+    "--output": ("output", pathlib.Path),
+    "--format": ("format", str),
+    "--proxy": ("proxy", str),
+    "--extra-option": ("extra_option", str),
+    "--concurrency": ("concurrency", _positive_int),
+    "--workers": ("workers", _positive_int),
+    "--cache-ttl": ("cache_ttl", _non_negative_seconds),
+}
+_FAST_DEFAULTS: Dict[str, Any] = {
+    "output": None,
+    "format": None,
+    "proxy": None,
+    "extra_option": None,
+    "concurrency": _DEFAULT_CONCURRENCY,
+    "workers": None,
+    "cache_ttl": _DEFAULT_CACHE_TTL,
+    **{dest: False for dest in _FAST_SWITCHES.values()},
+}
+
+
+def _fast_option_value(
+    option: str, separator: str, value: str, args: Iterator[str]
+) -> Optional[tuple[str, Any]]:
+    # Resolve a value-taking option to its destination and converted value,
+    # taking the value from the next argument unless it was given inline.
+    # Returns None whenever argparse has to handle the option instead.
+    if option not in _FAST_VALUES:
+        return None
+    if not separator:
+        next_arg = next(args, None)
+        if next_arg is None or next_arg.startswith("-"):
+            return None
+        value = next_arg
+
+    dest, convert = _FAST_VALUES[option]
+    try:
+        return dest, convert(value)
+    except Exception:
+        return None
+
+
+def _fast_parse(argv: list[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command line forms without argparse.
+
+    Returns ``None`` for anything unusual (``--help``, unknown or abbreviated
+    options, invalid values, ...) so the caller can fall back to argparse,
+    which then produces the usual help text or error message.
+    """
+
+    values = dict(_FAST_DEFAULTS)
+    urls: list[str] = []
+    extra_options: list[str] = []
+    urls_open = False
+    args = iter(argv)
+    for arg in args:
+        if not arg.startswith("-"):
+            # argparse only accepts the URLs as one contiguous run.
+            if urls and not urls_open:
+                return None
+            urls.append(arg)
+            urls_open = True
+            continue
+
+        urls_open = False
+        option, separator, value = arg.partition("=")
+        if option in _FAST_SWITCHES and not separator:
+            values[_FAST_SWITCHES[option]] = True
+            continue
+
+        parsed = _fast_option_value(option, separator, value, args)
+        if parsed is None:
+            return None
+        dest, converted = parsed
+        if dest == "extra_option":
+            extra_options.append(converted)
+        else:
+            values[dest] = converted
+
+    if not urls:
+        return None
+
+    values["urls"] = urls
+    values["extra_option"] = extra_options or None
+    return SimpleNamespace(**values)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> "argparse.ArgumentParser":
+    import argparse
 
-def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Download or inspect YouTube videos using yt-dlp",
     )
-    parser.add_argument("url", help="The YouTube video URL to process")
+    parser.add_argument(
+        "urls",
+        nargs="+",
+        metavar="url",
+        help="One or more YouTube video URLs to process",
+    )
     parser.add_argument(
         "--output",
         type=pathlib.Path,
@@ -37,6 +172,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Only show metadata without downloading",
     )
+    parser.add_argument(
+        "--with-info",
+        action="store_true",
+        help="Download and also show metadata, reusing a single extraction per URL",
+    )
     parser.add_argument(
         "--proxy",
         help="Proxy URL to use when contacting YouTube",
@@ -50,7 +190,36 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--json",
         action="store_true",
-        help="Emit metadata as JSON when using --info",
+        help="Emit metadata as JSON when using --info or --with-info "
+        "(with --with-info each document also carries the downloaded filename)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=_DEFAULT_CONCURRENCY,
+        help="Maximum number of simultaneous downloads when several URLs are given (default: 4)",
+    )
+    parser.add_argument(
+        "--concat-playlist",
+        action="store_true",
+        help="Download several URLs sequentially through a single yt-dlp session",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        help="Download several URLs in this many worker processes instead of threads",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk metadata cache when using --info",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=_non_negative_seconds,
+        default=_DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help="How long cached metadata stays valid (default: %(default)g)",
     )
     parser.add_argument(
         "--verbose",
@@ -64,61 +233,186 @@ def _parse_extra_options(pairs: Optional[list[str]]) -> Dict[str, Any]:
     if not pairs:
         return {}
 
-    options: Dict[str, Any] = {}
-    for pair in pairs:
-        if "=" not in pair:
-            raise argparse.ArgumentTypeError(
-                f"Invalid --extra-option '{pair}'. Expected KEY=VALUE format."
-            )
-        key, value = pair.split("=", 1)
-        options[key] = value
-    return options
+    parts = [pair.partition("=") for pair in pairs]
+    for key, separator, _ in parts:
+        if not separator:
+            raise ValueError(f"Invalid --extra-option '{key}'. Expected KEY=VALUE format.")
+    return {key: value for key, _, value in parts}
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+def _configure_logging(verbose: bool) -> None:
+    global _LOG_CONFIGURED
+
+    level = logging.DEBUG if verbose else logging.INFO
+    root = logging.getLogger()
+    if _LOG_CONFIGURED:
+        # main() may run many times in one process; only adjust the level
+        # of the handler set up below.
+        root.setLevel(level)
+        return
+
+    if root.handlers:
+        # The embedding application owns the logging configuration.
+        return
+
+    logging.basicConfig(level=level, format="[%(levelname)s] %(message)s")
+    _LOG_CONFIGURED = True
+
+
+def _stdout_write() -> Callable[[bytes], Any]:
+    # Write encoded JSON straight to the binary buffer when there is one,
+    # skipping the text layer's decode/encode round trip.
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        return lambda data: sys.stdout.write(data.decode("utf-8"))
+    return buffer.write
+
+
+def _write_json(documents: Iterable[bytes], *, as_array: bool) -> None:
+    write = _stdout_write()
+    if not as_array:
+        for document in documents:
+            write(document)
+            write(b"\n")
+    else:
+        # Emit each document as soon as it is available instead of
+        # collecting the whole list first.
+        write(b"[\n")
+        for index, document in enumerate(documents):
+            if index:
+                write(b",\n")
+            write(document)
+        write(b"\n]\n")
+    sys.stdout.flush()
+
+
+def _json_documents(infos: Iterable[VideoInfo]) -> Iterator[bytes]:
+    for info in infos:
+        yield info.to_json_bytes()
+
+
+def _print_info(info: VideoInfo) -> None:
+    print(f"Title: {info.title}")
+    if info.uploader:
+        print(f"Uploader: {info.uploader}")
+    if info.duration is not None:
+        print(f"Duration: {info.duration} seconds")
+    if info.view_count is not None:
+        print(f"Views: {info.view_count}")
+    print(f"URL: {info.webpage_url}")
+
+
+def _extract_infos(
+    urls: Iterable[str],
+    *,
+    proxy: Optional[str],
+    use_cache: bool,
+    cache_ttl: float,
+) -> Iterator[VideoInfo]:
+    # A generator (rather than a list) lets JSON output start before every
+    # URL has been extracted.
+    for url in urls:
+        yield extract_video_info(
+            url, proxy=proxy, use_cache=use_cache, cache_ttl=cache_ttl
+        )
 
-    logging.basicConfig(
-        level=logging.DEBUG if args.verbose else logging.INFO,
-        format="[%(levelname)s] %(message)s",
+
+def _show_infos(args: Any) -> None:
+    extracted = _extract_infos(
+        args.urls,
+        proxy=args.proxy,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl,
+    )
+    if args.json:
+        _write_json(_json_documents(extracted), as_array=len(args.urls) > 1)
+    else:
+        for info in extracted:
+            _print_info(info)
+
+
+def _download_all(
+    downloader: VideoDownloader, args: Any, extra_options: Dict[str, Any]
+) -> tuple[list[VideoInfo], list[pathlib.Path]]:
+    """Download every URL the way the command line asked for.
+
+    Metadata is only returned (and only extracted) with ``--with-info``."""
+
+    options: Dict[str, Any] = {
+        "audio_only": args.audio_only,
+        "format": args.format,
+        "extra_options": extra_options,
+    }
+    if args.with_info:
+        # Downloads run one after another so that each URL needs only
+        # one extraction for both its metadata and its file.
+        results = [downloader.fetch_and_download(url, **options) for url in args.urls]
+        return [info for info, _ in results], [path for _, path in results]
+    if len(args.urls) == 1:
+        return [], [downloader.download(args.urls[0], **options)]
+    if args.concat_playlist:
+        return [], downloader.download_batch(args.urls, **options)
+    if args.workers is not None:
+        return [], downloader.download_many_parallel(
+            args.urls, workers=args.workers, **options
+        )
+    return [], asyncio.run(
+        downloader.download_many(args.urls, concurrency=args.concurrency, **options)
     )
 
+
+def _report_downloads(
+    infos: list[VideoInfo], downloaded_paths: list[pathlib.Path], *, as_json: bool
+) -> None:
+    if infos and as_json:
+        # Keep stdout a single JSON stream by embedding each path in the
+        # metadata document instead of printing it separately.
+        _write_json(
+            [
+                info.to_json_bytes(filename=str(downloaded_path))
+                for info, downloaded_path in zip(infos, downloaded_paths)
+            ],
+            as_array=len(infos) > 1,
+        )
+        return
+
+    for info in infos:
+        _print_info(info)
+    for downloaded_path in downloaded_paths:
+        print(downloaded_path)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args: Any = _fast_parse(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+
+    _configure_logging(args.verbose)
+
     try:
         extra_options = _parse_extra_options(args.extra_option)
-    except argparse.ArgumentTypeError as exc:
-        parser.error(str(exc))
+    except ValueError as exc:
+        _build_parser().error(str(exc))
         return 2  # pragma: no cover - parser.error exits
 
     if args.info:
-        info = extract_video_info(args.url, proxy=args.proxy)
-        if args.json:
-            print(info.to_json())
-        else:
-            print(f"Title: {info.title}")
-            if info.uploader:
-                print(f"Uploader: {info.uploader}")
-            if info.duration is not None:
-                print(f"Duration: {info.duration} seconds")
-            if info.view_count is not None:
-                print(f"Views: {info.view_count}")
-            print(f"URL: {info.webpage_url}")
+        _show_infos(args)
         return 0
 
     downloader = VideoDownloader(output_dir=args.output, proxy=args.proxy)
-
     try:
-        downloaded_path = downloader.download(
-            args.url,
-            audio_only=args.audio_only,
-            format=args.format,
-            extra_options=extra_options,
-        )
+        infos, downloaded_paths = _download_all(downloader, args, extra_options)
     except Exception as exc:  # pragma: no cover - top level CLI error handling
         LOGGER.error("Failed to download video: %s", exc)
         return 1
+    finally:
+        downloader.close()
 
-    print(str(downloaded_path))
+    _report_downloads(infos, downloaded_paths, as_json=args.json)
     return 0
 
 
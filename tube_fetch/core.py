@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import dataclasses
+import functools
+import hashlib
+import importlib.util
+import itertools
 import json
 import logging
+import math
+import os
 import pathlib
-from typing import Any, Dict, Iterable, Optional
+import tempfile
+import time
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Literal, Mapping, Optional, Union, overload
+
+_IMPORT_ERROR: Optional[Exception]
 
 try:
     import yt_dlp  # type: ignore
@@ -16,6 +30,11 @@ except Exception as exc:  # pragma: no cover - import guard
 else:  # pragma: no cover - import guard
     _IMPORT_ERROR = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -44,14 +63,38 @@ class VideoInfo:
     like_count: Optional[int] = None
     upload_date: Optional[str] = None
 
+    def _to_dict(self) -> Dict[str, Any]:
+        # All fields are scalars, so a shallow dict avoids the recursive
+        # copy performed by dataclasses.asdict().
+        return {name: getattr(self, name) for name in self.__slots__}
+
     def to_json(self) -> str:
         """Serialize the :class:`VideoInfo` to a JSON string."""
 
-        return json.dumps(dataclasses.asdict(self), ensure_ascii=False, indent=2)
+        if orjson is not None:
+            return orjson.dumps(self._to_dict(), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self._to_dict(), ensure_ascii=False, indent=2)
+
+    def to_json_bytes(self, *, filename: Optional[str] = None) -> bytes:
+        """Serialize the :class:`VideoInfo` to UTF-8 encoded JSON.
+
+        When ``filename`` is given it is added to the document as a
+        ``"filename"`` field."""
+
+        data = self._to_dict()
+        if filename is not None:
+            data["filename"] = filename
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 _DEFAULT_FORMAT = "bestvideo+bestaudio/best"
 _DEFAULT_AUDIO_FORMAT = "bestaudio/best"
+_FORMAT_BY_AUDIO = {False: _DEFAULT_FORMAT, True: _DEFAULT_AUDIO_FORMAT}
+_DEFAULT_INFO_CACHE_TTL = 300.0
+_DEFAULT_CACHE_TTL = 3600.0
+_MAX_OPEN_SESSIONS = 4
 
 
 def _ensure_backend() -> None:
@@ -59,6 +102,23 @@ def _ensure_backend() -> None:
         raise YTDLPNotInstalledError() from _IMPORT_ERROR
 
 
+@functools.lru_cache(maxsize=1)
+def _impersonate_target() -> Any:
+    # Impersonation is served by yt-dlp's curl_cffi request handler, which
+    # also negotiates HTTP/2; only request it when that backend exists.
+    if importlib.util.find_spec("curl_cffi") is None:
+        return None
+    try:
+        # Importing the handler module is what registers it; yt-dlp raises
+        # ImportError here for curl_cffi versions it does not support, in
+        # which case YoutubeDL would reject the impersonate option.
+        import yt_dlp.networking._curlcffi  # type: ignore  # noqa: F401
+        from yt_dlp.networking.impersonate import ImpersonateTarget  # type: ignore
+    except Exception:
+        return None
+    return ImpersonateTarget.from_str("chrome")
+
+
 def _build_options(
     output_dir: Optional[pathlib.Path] = None,
     *,
@@ -66,16 +126,27 @@ def _build_options(
     format: Optional[str] = None,
     proxy: Optional[str] = None,
     extra_options: Optional[Dict[str, Any]] = None,
+    download: bool = True,
 ) -> Dict[str, Any]:
     options: Dict[str, Any] = {
-        "outtmpl": str((output_dir or pathlib.Path.cwd()) / "%(title)s.%(ext)s"),
-        "format": format
-        or (_DEFAULT_AUDIO_FORMAT if audio_only else _DEFAULT_FORMAT),
+        "format": format or _FORMAT_BY_AUDIO[audio_only],
         "noplaylist": True,
         "quiet": True,
         "nocheckcertificate": True,
     }
 
+    impersonate = _impersonate_target()
+    if impersonate is not None:
+        # Routes requests through yt-dlp's curl_cffi handler, whose sessions
+        # speak HTTP/2 and let manifest and fragment requests share one
+        # TCP/TLS connection.
+        options["impersonate"] = impersonate
+
+    if download:
+        # Metadata-only calls never write files, so skip resolving the
+        # working directory for them.
+        options["outtmpl"] = str((output_dir or pathlib.Path.cwd()) / "%(title)s.%(ext)s")
+
     if proxy:
         options["proxy"] = proxy
 
@@ -85,7 +156,144 @@ def _build_options(
     return options
 
 
-def extract_video_info(url: str, *, proxy: Optional[str] = None) -> VideoInfo:
+def _default_cache_dir() -> Optional[pathlib.Path]:
+    override = os.environ.get("TUBE_FETCH_CACHE_DIR")
+    if override:
+        return pathlib.Path(override)
+
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        return pathlib.Path(base) / "tube_fetch"
+    try:
+        home = pathlib.Path.home()
+    except (RuntimeError, OSError):
+        # No $HOME and no passwd entry (e.g. an arbitrary container UID).
+        return None
+    return home / ".cache" / "tube_fetch"
+
+
+class _MetaCache:
+    """JSON files on disk holding metadata keyed by URL, each with an expiry.
+
+    When no cache directory can be determined, every lookup misses and
+    nothing is written."""
+
+    def __init__(self, directory: Optional[pathlib.Path] = None) -> None:
+        self.directory = directory or _default_cache_dir()
+
+    def _path(self, url: str) -> pathlib.Path:
+        assert self.directory is not None
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        if self.directory is None:
+            return None
+
+        path = self._path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        expires = entry.get("expires") if isinstance(entry, dict) else None
+        if (
+            not isinstance(expires, (int, float))
+            or not math.isfinite(expires)
+            or expires < time.time()
+            or not isinstance(entry.get("value"), dict)
+        ):
+            # Expired or malformed entries are treated as misses.
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry["value"]
+
+    def set(self, url: str, value: Dict[str, Any], ttl: float) -> None:
+        if self.directory is None:
+            return
+
+        entry = {"expires": time.time() + ttl, "value": value}
+        temp_name: Optional[str] = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never
+            # observe a partially written entry.
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temp_name = handle.name
+                json.dump(entry, handle, ensure_ascii=False)
+            os.replace(temp_name, self._path(url))
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("Could not write metadata cache for %s: %s", url, exc)
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+
+
+# yt-dlp info keys in VideoInfo field order, so instances can be built
+# positionally from a single pass over the dict.
+_INFO_KEYS = VideoInfo.__slots__
+
+
+def _info_from_dict(info: Dict[str, Any], url: str) -> VideoInfo:
+    values: list[Any] = list(map(info.get, _INFO_KEYS))
+    values[0] = values[0] or ""
+    values[1] = values[1] or ""
+    values[4] = values[4] or url
+    return VideoInfo(*values)
+
+
+def _filename_from_result(result: Dict[str, Any]) -> str:
+    # When using newer yt-dlp releases the return value may be a dict
+    # containing multiple downloads; pick the first produced file.
+    downloads: Optional[Iterable[Dict[str, Any]]] = result.get("requested_downloads")
+    if downloads:
+        filename = next(
+            (download["_filename"] for download in downloads if download.get("_filename")),
+            None,
+        )
+        if filename:
+            return filename
+
+    filename = result.get("_filename")
+    if not filename:
+        raise RuntimeError("yt-dlp did not report a download filename")
+
+    return filename
+
+
+def _download_with(
+    ydl: Any,
+    url: str,
+    info: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Downloading %s with options %s", url, ydl.params)
+    if info is None:
+        return ydl.extract_info(url, download=True)
+
+    # Reuse previously extracted metadata instead of fetching the watch
+    # page again.
+    return ydl.process_ie_result(info, download=True)
+
+
+def extract_video_info(
+    url: str,
+    *,
+    proxy: Optional[str] = None,
+    use_cache: bool = True,
+    cache_ttl: float = _DEFAULT_CACHE_TTL,
+) -> VideoInfo:
     """Extract metadata for a YouTube video.
 
     Parameters
@@ -94,29 +302,54 @@ def extract_video_info(url: str, *, proxy: Optional[str] = None) -> VideoInfo:
         The YouTube video URL to extract information from.
     proxy:
         Optional proxy string to use for the request.
+    use_cache:
+        Whether to consult and update the on-disk metadata cache. The cache
+        lives in ``$TUBE_FETCH_CACHE_DIR`` or ``$XDG_CACHE_HOME/tube_fetch``.
+    cache_ttl:
+        Number of seconds a freshly extracted entry stays valid.
     """
 
+    cache = _MetaCache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            try:
+                info = VideoInfo(**cached)
+            except TypeError:
+                pass  # Entry written by an incompatible version; refetch.
+            else:
+                LOGGER.debug("Using cached information for %s", url)
+                return info
+
     _ensure_backend()
 
-    options = _build_options(proxy=proxy)
+    options = _build_options(proxy=proxy, download=False)
 
     with yt_dlp.YoutubeDL(options) as ydl:  # type: ignore[attr-defined]
-        LOGGER.debug("Extracting information for %s", url)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Extracting information for %s", url)
         info = ydl.extract_info(url, download=False)
 
-    return VideoInfo(
-        id=info.get("id", ""),
-        title=info.get("title", ""),
-        uploader=info.get("uploader"),
-        duration=info.get("duration"),
-        webpage_url=info.get("webpage_url", url),
-        description=info.get("description"),
-        view_count=info.get("view_count"),
-        like_count=info.get("like_count"),
-        upload_date=info.get("upload_date"),
-    )
+    video_info = _info_from_dict(info, url)
+    if cache is not None:
+        cache.set(url, video_info._to_dict(), cache_ttl)
+    return video_info
+
+
+@overload
+def download_video(
+    url: str,
+    output_dir: Optional[pathlib.Path] = None,
+    *,
+    audio_only: bool = False,
+    format: Optional[str] = None,
+    proxy: Optional[str] = None,
+    extra_options: Optional[Dict[str, Any]] = None,
+    as_path: Literal[True] = True,
+) -> pathlib.Path: ...
 
 
+@overload
 def download_video(
     url: str,
     output_dir: Optional[pathlib.Path] = None,
@@ -125,10 +358,24 @@ def download_video(
     format: Optional[str] = None,
     proxy: Optional[str] = None,
     extra_options: Optional[Dict[str, Any]] = None,
-) -> pathlib.Path:
+    as_path: Literal[False],
+) -> str: ...
+
+
+def download_video(
+    url: str,
+    output_dir: Optional[pathlib.Path] = None,
+    *,
+    audio_only: bool = False,
+    format: Optional[str] = None,
+    proxy: Optional[str] = None,
+    extra_options: Optional[Dict[str, Any]] = None,
+    as_path: bool = True,
+) -> Union[pathlib.Path, str]:
     """Download a YouTube video or audio track.
 
-    Returns the path to the downloaded file."""
+    Returns the path to the downloaded file, as a plain string when
+    ``as_path`` is false."""
 
     _ensure_backend()
 
@@ -140,40 +387,173 @@ def download_video(
         extra_options=extra_options,
     )
 
-    with yt_dlp.YoutubeDL(options) as ydl:  # type: ignore[attr-defined]
-        LOGGER.debug("Downloading %s with options %s", url, options)
-        result = ydl.extract_info(url, download=True)
-
-    if "requested_downloads" in result:
-        # When using newer yt-dlp releases the return value may be a dict
-        # containing multiple downloads; pick the first produced file.
-        downloads: Iterable[Dict[str, Any]] = result["requested_downloads"]
-        for download in downloads:
-            filename = download.get("_filename")
-            if filename:
-                return pathlib.Path(filename)
+    filename = _download_fresh(url, options)
+    return pathlib.Path(filename) if as_path else filename
 
-    filename = result.get("_filename")
-    if not filename:
-        raise RuntimeError("yt-dlp did not report a download filename")
 
-    return pathlib.Path(filename)
+def _download_fresh(url: str, options: Mapping[str, Any]) -> str:
+    # yt-dlp mutates the params it is given, so always hand it a copy.
+    with yt_dlp.YoutubeDL(dict(options)) as ydl:  # type: ignore[attr-defined]
+        result = _download_with(ydl, url)
+    return _filename_from_result(result)
+
+
+def _process_worker(url: str, options: Dict[str, Any]) -> str:
+    # Entry point for ProcessPoolExecutor children; must stay module level
+    # so it can be pickled.
+    _ensure_backend()
+    return _download_fresh(url, options)
 
 
 class VideoDownloader:
-    """High level API for downloading videos and metadata."""
+    """High level API for downloading videos and metadata.
+
+    Metadata fetched through :meth:`fetch_info` is kept for
+    ``info_cache_ttl`` seconds so that a following :meth:`download` of the
+    same URL does not extract it again.
+
+    ``yt_dlp.YoutubeDL`` instances are kept open and reused for every call
+    sharing the same options; use the downloader as a context manager or
+    call :meth:`close` to release them. At most four such sessions stay
+    open, the least recently used one being closed first. Because the
+    sessions are shared, a downloader must not be used from several
+    threads at once.
+
+    If ``curl_cffi`` is installed (and supported by yt-dlp), every request
+    is sent through yt-dlp's curl_cffi handler impersonating Chrome.
+
+    When ``output_dir`` is omitted, the working directory is resolved once
+    at construction time (or when ``output_dir``/``proxy`` is reassigned);
+    pass ``output_dir`` explicitly if the process changes directories.
+    """
 
     def __init__(
         self,
         *,
         output_dir: Optional[pathlib.Path] = None,
         proxy: Optional[str] = None,
+        info_cache_ttl: float = _DEFAULT_INFO_CACHE_TTL,
     ) -> None:
-        self.output_dir = output_dir
-        self.proxy = proxy
+        self.info_cache_ttl = info_cache_ttl
+        self._info_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._ydls: Dict[str, Any] = {}
+        self._output_dir = output_dir
+        self._proxy = proxy
+        self._rebuild_options()
+
+    @property
+    def output_dir(self) -> Optional[pathlib.Path]:
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, value: Optional[pathlib.Path]) -> None:
+        self._output_dir = value
+        self._rebuild_options()
+
+    @property
+    def proxy(self) -> Optional[str]:
+        return self._proxy
+
+    @proxy.setter
+    def proxy(self, value: Optional[str]) -> None:
+        self._proxy = value
+        self._rebuild_options()
+
+    def _rebuild_options(self) -> None:
+        # Options shared by every call, computed once; per-call settings are
+        # layered on top in _options_for(). Open sessions were built from the
+        # previous template, so they are closed as well.
+        self._base_options: Mapping[str, Any] = MappingProxyType(
+            {
+                key: value
+                for key, value in _build_options(self._output_dir, proxy=self._proxy).items()
+                if key != "format"
+            }
+        )
+        # ChainMap only ever writes to its first mapping, so the read-only
+        # template is safe to place underneath.
+        self._default_options: Mapping[str, Any] = ChainMap(
+            {"format": _DEFAULT_FORMAT}, self._base_options  # type: ignore[arg-type]
+        )
+        self.close()
+
+    def __enter__(self) -> "VideoDownloader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every ``yt_dlp.YoutubeDL`` instance held by the downloader."""
+
+        ydls, self._ydls = self._ydls, {}
+        for ydl in ydls.values():
+            ydl.close()
+
+    def _options_for(
+        self,
+        *,
+        audio_only: bool = False,
+        format: Optional[str] = None,
+        extra_options: Optional[Dict[str, Any]] = None,
+    ) -> Mapping[str, Any]:
+        if not extra_options and format is None and not audio_only:
+            return self._default_options
+
+        fmt = format or _FORMAT_BY_AUDIO[audio_only]
+        return ChainMap(
+            extra_options or {}, {"format": fmt}, self._base_options  # type: ignore[arg-type]
+        )
+
+    def _ydl_for(self, options: Mapping[str, Any]) -> Any:
+        # yt-dlp derives state such as the format selector and output
+        # template from its params at construction time, so instances are
+        # shared per option set rather than patched between calls.
+        if options is self._default_options:
+            # Common case: no per-call overrides, so skip building a key.
+            key = ""
+        else:
+            key = repr(sorted(options.items()))
+        # Re-inserting keeps the dict ordered from least to most recently used.
+        ydl = self._ydls.pop(key, None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(options))  # type: ignore[attr-defined]
+            if len(self._ydls) >= _MAX_OPEN_SESSIONS:
+                self._ydls.pop(next(iter(self._ydls))).close()
+        self._ydls[key] = ydl
+        return ydl
+
+    def _cached_info(self, url: str) -> Optional[Dict[str, Any]]:
+        entry = self._info_cache.get(url)
+        if entry is None:
+            return None
+
+        expires, info = entry
+        if expires < time.monotonic():
+            del self._info_cache[url]
+            return None
+        return info
 
     def fetch_info(self, url: str) -> VideoInfo:
-        return extract_video_info(url, proxy=self.proxy)
+        info = self._cached_info(url)
+        if info is not None:
+            return _info_from_dict(info, url)
+
+        _ensure_backend()
+        ydl = self._ydl_for(self._default_options)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Extracting information for %s", url)
+        # Keep the unprocessed extractor result: processing runs format
+        # selection and stores its outcome (``requested_formats`` etc.) in the
+        # dict, which a later download with another format would inherit.
+        info = ydl.extract_info(url, download=False, process=False)
+        if info.get("_type", "video") != "video":
+            # Redirects and playlists only carry full metadata once resolved;
+            # those results are not reused for downloading.
+            return _info_from_dict(ydl.process_ie_result(info, download=False), url)
+
+        self._info_cache[url] = (time.monotonic() + self.info_cache_ttl, info)
+        return _info_from_dict(info, url)
 
     def download(
         self,
@@ -183,11 +563,127 @@ class VideoDownloader:
         format: Optional[str] = None,
         extra_options: Optional[Dict[str, Any]] = None,
     ) -> pathlib.Path:
-        return download_video(
-            url,
-            self.output_dir,
-            audio_only=audio_only,
-            format=format,
-            proxy=self.proxy,
-            extra_options=extra_options,
+        _ensure_backend()
+
+        options = self._options_for(
+            audio_only=audio_only, format=format, extra_options=extra_options
+        )
+        return pathlib.Path(_filename_from_result(self._download_result(url, options)))
+
+    def _download_result(self, url: str, options: Mapping[str, Any]) -> Dict[str, Any]:
+        info = self._cached_info(url)
+        # yt-dlp updates the info dict in place while downloading, so it
+        # must not be handed out again afterwards.
+        self._info_cache.pop(url, None)
+        return _download_with(self._ydl_for(options), url, info)
+
+    def download_batch(
+        self,
+        urls: Iterable[str],
+        *,
+        audio_only: bool = False,
+        format: Optional[str] = None,
+        extra_options: Optional[Dict[str, Any]] = None,
+    ) -> list[pathlib.Path]:
+        """Download several videos one after another in one yt-dlp session.
+
+        Every URL goes through the same ``YoutubeDL`` instance, so cookies,
+        extractor state and the signature cache are only set up once, unlike
+        :meth:`download_many` where each worker opens its own session."""
+
+        _ensure_backend()
+
+        options = self._options_for(
+            audio_only=audio_only, format=format, extra_options=extra_options
+        )
+        return [
+            pathlib.Path(_filename_from_result(self._download_result(url, options)))
+            for url in urls
+        ]
+
+    def fetch_and_download(
+        self,
+        url: str,
+        *,
+        audio_only: bool = False,
+        format: Optional[str] = None,
+        extra_options: Optional[Dict[str, Any]] = None,
+    ) -> tuple[VideoInfo, pathlib.Path]:
+        """Download a video and return its metadata along with the file path.
+
+        Both come from a single yt-dlp extraction, saving the round trip of
+        calling :meth:`fetch_info` before :meth:`download`."""
+
+        _ensure_backend()
+
+        options = self._options_for(
+            audio_only=audio_only, format=format, extra_options=extra_options
+        )
+        result = self._download_result(url, options)
+        return _info_from_dict(result, url), pathlib.Path(_filename_from_result(result))
+
+    async def download_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 4,
+        audio_only: bool = False,
+        format: Optional[str] = None,
+        extra_options: Optional[Dict[str, Any]] = None,
+    ) -> list[pathlib.Path]:
+        """Download several videos concurrently.
+
+        yt-dlp is blocking, so each download runs in a worker thread; at most
+        ``concurrency`` downloads are in flight at once. The returned paths
+        follow the order of ``urls``."""
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        _ensure_backend()
+
+        # Worker threads each get their own YoutubeDL, which is not
+        # thread-safe, but the options are only assembled once per batch.
+        options = self._options_for(
+            audio_only=audio_only, format=format, extra_options=extra_options
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _download_one(url: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(_download_fresh, url, options)
+
+        filenames = await asyncio.gather(*(_download_one(url) for url in urls))
+        return [pathlib.Path(filename) for filename in filenames]
+
+    def download_many_parallel(
+        self,
+        urls: Iterable[str],
+        *,
+        workers: Optional[int] = None,
+        audio_only: bool = False,
+        format: Optional[str] = None,
+        extra_options: Optional[Dict[str, Any]] = None,
+    ) -> list[pathlib.Path]:
+        """Download several videos in separate worker processes.
+
+        Unlike :meth:`download_many`, post-processing and signature
+        deciphering run outside the GIL. ``workers`` defaults to the number
+        of CPUs. ``extra_options`` must be picklable. The returned paths
+        follow the order of ``urls``."""
+
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        _ensure_backend()
+
+        options = dict(
+            self._options_for(
+                audio_only=audio_only, format=format, extra_options=extra_options
+            )
         )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return [
+                pathlib.Path(filename)
+                for filename in executor.map(_process_worker, urls, itertools.repeat(options))
+            ]